@@ -1,6 +1,51 @@
 """AI tools for the Tasks module."""
+import base64
+import json
+import uuid
+
 from assistant.tools import AssistantTool, register_tool
 
+LIST_TASKS_MAX_LIMIT = 100
+CREATE_TASKS_BULK_MAX_ITEMS = 50
+
+
+def _create_task_kwargs(args):
+    return dict(
+        title=args['title'], description=args.get('description', ''),
+        task_type=args.get('task_type', 'task'), priority=args.get('priority', 'medium'),
+        due_date=args.get('due_date'), assigned_to=args.get('assigned_to'),
+        customer_id=args.get('customer_id'), location=args.get('location', ''),
+        duration_minutes=args.get('duration_minutes', 0),
+    )
+
+
+def _encode_cursor(row):
+    """Opaque keyset cursor for the (priority_rank, due_date, id) sort key."""
+    due_date = row['due_date'].isoformat() if row['due_date'] else None
+    key = [row['priority_rank'], due_date, str(row['id'])]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _cursor_filter(token):
+    """Q selecting the rows after ``token`` in ListTasks order (NULL due dates last)."""
+    from django.db.models import Q
+    from django.utils.dateparse import parse_datetime
+    rank, due_date, pk = json.loads(base64.urlsafe_b64decode(token.encode()))
+    rank, pk = int(rank), uuid.UUID(str(pk))
+    # priority_rank__gte gives the index scan a start key; the OR then drops rows up to the cursor.
+    bound = Q(priority_rank__gte=rank)
+    if due_date is None:
+        return bound & (Q(priority_rank__gt=rank) | Q(priority_rank=rank, due_date__isnull=True, id__gt=pk))
+    due_date = parse_datetime(due_date)
+    if due_date is None:
+        raise ValueError('Invalid cursor due date')
+    return bound & (
+        Q(priority_rank__gt=rank)
+        | Q(priority_rank=rank, due_date__isnull=True)
+        | Q(priority_rank=rank, due_date__gt=due_date)
+        | Q(priority_rank=rank, due_date=due_date, id__gt=pk)
+    )
+
 
 @register_tool
 class ListTasks(AssistantTool):
@@ -16,34 +61,43 @@ class ListTasks(AssistantTool):
             "task_type": {"type": "string", "description": "task, call, meeting, email, follow_up"},
             "assigned_to": {"type": "string"}, "customer_id": {"type": "string"},
             "overdue": {"type": "boolean", "description": "Only show overdue tasks"},
-            "limit": {"type": "integer"},
+            "limit": {"type": "integer", "description": f"Max {LIST_TASKS_MAX_LIMIT}"},
+            "cursor": {"type": "string", "description": "next_cursor from a previous call, to fetch the next page"},
         },
         "required": [],
         "additionalProperties": False,
     }
 
     def execute(self, args, request):
-        from tasks.models import Task
-        from django.utils import timezone
-        qs = Task.objects.all()
-        if args.get('status'):
-            qs = qs.filter(status=args['status'])
-        if args.get('priority'):
-            qs = qs.filter(priority=args['priority'])
-        if args.get('task_type'):
-            qs = qs.filter(task_type=args['task_type'])
-        if args.get('assigned_to'):
-            qs = qs.filter(assigned_to=args['assigned_to'])
-        if args.get('customer_id'):
-            qs = qs.filter(customer_id=args['customer_id'])
+        from tasks.models import Task, overdue_flag
+        from django.db.models import F, Q
+        from django.db.models.functions import Now, Substr
+        q = Q(hub_id=request.session.get('hub_id'))
+        for field in ('status', 'priority', 'task_type', 'assigned_to', 'customer_id'):
+            if args.get(field):
+                q &= Q(**{field: args[field]})
         if args.get('overdue'):
-            qs = qs.filter(status__in=['pending', 'in_progress'], due_date__lt=timezone.now())
-        limit = args.get('limit', 20)
+            q &= Q(status__in=['pending', 'in_progress'], due_date__lt=Now())
+        if args.get('cursor'):
+            try:
+                q &= _cursor_filter(args['cursor'])
+            except (ValueError, TypeError):
+                return {"error": "Invalid cursor"}
+        qs = Task.objects.filter(q)
+        limit = max(1, min(int(args.get('limit') or 20), LIST_TASKS_MAX_LIMIT))
+        rows = list(
+            qs.annotate(desc_short=Substr('description', 1, 100), overdue=overdue_flag())
+            .order_by('priority_rank', F('due_date').asc(nulls_last=True), 'id')
+            .values('id', 'title', 'task_type', 'priority', 'priority_rank', 'status', 'due_date', 'desc_short', 'customer__name', 'overdue')[:limit + 1]
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         return {
             "tasks": [
-                {"id": str(t.id), "title": t.title, "task_type": t.task_type, "priority": t.priority, "status": t.status, "due_date": str(t.due_date) if t.due_date else None, "description": t.description[:100]}
-                for t in qs.order_by('-priority', 'due_date')[:limit]
-            ]
+                {"id": str(r['id']), "title": r['title'], "task_type": r['task_type'], "priority": r['priority'], "status": r['status'], "due_date": str(r['due_date']) if r['due_date'] else None, "description": r['desc_short'], "customer_name": r['customer__name'] or '', "is_overdue": r['overdue']}
+                for r in rows
+            ],
+            "next_cursor": _encode_cursor(rows[-1]) if has_more else None,
         }
 
 
@@ -70,16 +124,42 @@ class CreateTask(AssistantTool):
 
     def execute(self, args, request):
         from tasks.models import Task
-        t = Task.objects.create(
-            title=args['title'], description=args.get('description', ''),
-            task_type=args.get('task_type', 'task'), priority=args.get('priority', 'medium'),
-            due_date=args.get('due_date'), assigned_to=args.get('assigned_to'),
-            customer_id=args.get('customer_id'), location=args.get('location', ''),
-            duration_minutes=args.get('duration_minutes', 0),
-        )
+        t = Task.objects.create(**_create_task_kwargs(args))
         return {"id": str(t.id), "title": t.title, "created": True}
 
 
+@register_tool
+class CreateTasksBulk(AssistantTool):
+    name = "create_tasks_bulk"
+    description = (
+        f"Create up to {CREATE_TASKS_BULK_MAX_ITEMS} tasks at once (e.g. a follow-up plan). "
+        "Each item takes the same fields as create_task."
+    )
+    module_id = "tasks"
+    required_permission = "tasks.add_task"
+    requires_confirmation = True
+    parameters = {
+        "type": "object",
+        "properties": {
+            "tasks": {"type": "array", "items": CreateTask.parameters, "maxItems": CREATE_TASKS_BULK_MAX_ITEMS},
+        },
+        "required": ["tasks"],
+        "additionalProperties": False,
+    }
+
+    def execute(self, args, request):
+        from tasks.models import Task
+        if len(args['tasks']) > CREATE_TASKS_BULK_MAX_ITEMS:
+            return {"error": f"At most {CREATE_TASKS_BULK_MAX_ITEMS} tasks per call"}
+        hub_id = request.session.get('hub_id')
+        # bulk_create skips HubBaseModel.save(), so the audit column is filled here
+        created_by = request.session.get('local_user_id')
+        objs = [Task(hub_id=hub_id, created_by=created_by, **_create_task_kwargs(a)) for a in args['tasks']]
+        Task.objects.bulk_create(objs)
+        Task.invalidate_list_cache(hub_id)
+        return {"tasks": [{"id": str(t.id), "title": t.title} for t in objs], "created": len(objs)}
+
+
 @register_tool
 class UpdateTaskStatus(AssistantTool):
     name = "update_task_status"
@@ -100,17 +180,22 @@ class UpdateTaskStatus(AssistantTool):
     def execute(self, args, request):
         from tasks.models import Task
         from django.utils import timezone
-        t = Task.objects.get(id=args['task_id'])
+        now = timezone.now()
+        updates = {'updated_at': now}
         if 'status' in args:
-            t.status = args['status']
+            updates['status'] = args['status']
             if args['status'] == 'completed':
-                t.completed_at = timezone.now()
+                updates['completed_at'] = now
         if 'priority' in args:
-            t.priority = args['priority']
+            updates['priority'] = args['priority']
         if 'result' in args:
-            t.result = args['result']
-        t.save()
-        return {"id": str(t.id), "status": t.status, "updated": True}
+            updates['result'] = args['result']
+        qs = Task.objects.filter(id=args['task_id'])
+        if not qs.update(**updates):
+            return {"error": "Task not found"}
+        Task.invalidate_list_cache(request.session.get('hub_id'))
+        status = updates.get('status') or qs.values_list('status', flat=True).first()
+        return {"id": args['task_id'], "status": status, "updated": True}
 
 
 @register_tool
@@ -140,7 +225,7 @@ class UpdateTask(AssistantTool):
         from django.utils import timezone
         from tasks.models import Task
         try:
-            t = Task.objects.get(id=args['task_id'])
+            t = Task.objects.defer('recurrence_rule').get(id=args['task_id'])
         except Task.DoesNotExist:
             return {"error": "Task not found"}
         for field in ('title', 'description', 'task_type', 'priority', 'due_date', 'location', 'duration_minutes', 'result'):
@@ -9,4 +9,4 @@ class TasksConfig(AppConfig):
     verbose_name = _('Tasks')
 
     def ready(self):
-        pass
+        from . import signals  # noqa: F401
@@ -3,27 +3,35 @@ from django.utils.translation import gettext_lazy as _
 
 from .models import Task, TaskSettings
 
+_INPUT_SM = {'class': 'input input-sm w-full'}
+_INPUT_SM_NUMBER = {**_INPUT_SM, 'type': 'number'}
+_INPUT_SM_TIME = {**_INPUT_SM, 'type': 'time'}
+_INPUT_SM_DATETIME = {**_INPUT_SM, 'type': 'datetime-local'}
+_SELECT_SM = {'class': 'select select-sm w-full'}
+_TEXTAREA_SM_3 = {'class': 'textarea textarea-sm w-full', 'rows': 3}
+_TOGGLE = {'class': 'toggle'}
+
 class TaskForm(forms.ModelForm):
     class Meta:
         model = Task
         fields = ['title', 'description', 'task_type', 'priority', 'status', 'due_date', 'completed_at', 'assigned_to', 'customer', 'related_lead', 'duration_minutes', 'result', 'location', 'is_recurring', 'recurrence_rule', 'reminder_before_minutes']
         widgets = {
-            'title': forms.TextInput(attrs={'class': 'input input-sm w-full'}),
-            'description': forms.Textarea(attrs={'class': 'textarea textarea-sm w-full', 'rows': 3}),
-            'task_type': forms.Select(attrs={'class': 'select select-sm w-full'}),
-            'priority': forms.Select(attrs={'class': 'select select-sm w-full'}),
-            'status': forms.Select(attrs={'class': 'select select-sm w-full'}),
-            'due_date': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'datetime-local'}),
-            'completed_at': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'datetime-local'}),
-            'assigned_to': forms.TextInput(attrs={'class': 'input input-sm w-full'}),
-            'customer': forms.Select(attrs={'class': 'select select-sm w-full'}),
-            'related_lead': forms.TextInput(attrs={'class': 'input input-sm w-full'}),
-            'duration_minutes': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'number'}),
-            'result': forms.Textarea(attrs={'class': 'textarea textarea-sm w-full', 'rows': 3}),
-            'location': forms.TextInput(attrs={'class': 'input input-sm w-full'}),
-            'is_recurring': forms.CheckboxInput(attrs={'class': 'toggle'}),
-            'recurrence_rule': forms.Textarea(attrs={'class': 'textarea textarea-sm w-full', 'rows': 3}),
-            'reminder_before_minutes': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'number'}),
+            'title': forms.TextInput(attrs=_INPUT_SM),
+            'description': forms.Textarea(attrs=_TEXTAREA_SM_3),
+            'task_type': forms.Select(attrs=_SELECT_SM),
+            'priority': forms.Select(attrs=_SELECT_SM),
+            'status': forms.Select(attrs=_SELECT_SM),
+            'due_date': forms.TextInput(attrs=_INPUT_SM_DATETIME),
+            'completed_at': forms.TextInput(attrs=_INPUT_SM_DATETIME),
+            'assigned_to': forms.TextInput(attrs=_INPUT_SM),
+            'customer': forms.Select(attrs=_SELECT_SM),
+            'related_lead': forms.TextInput(attrs=_INPUT_SM),
+            'duration_minutes': forms.TextInput(attrs=_INPUT_SM_NUMBER),
+            'result': forms.Textarea(attrs=_TEXTAREA_SM_3),
+            'location': forms.TextInput(attrs=_INPUT_SM),
+            'is_recurring': forms.CheckboxInput(attrs=_TOGGLE),
+            'recurrence_rule': forms.Textarea(attrs=_TEXTAREA_SM_3),
+            'reminder_before_minutes': forms.TextInput(attrs=_INPUT_SM_NUMBER),
         }
 
 class TaskSettingsForm(forms.ModelForm):
@@ -31,9 +39,9 @@ class TaskSettingsForm(forms.ModelForm):
         model = TaskSettings
         fields = ['default_reminder_minutes', 'auto_create_follow_up', 'working_hours_start', 'working_hours_end']
         widgets = {
-            'default_reminder_minutes': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'number'}),
-            'auto_create_follow_up': forms.CheckboxInput(attrs={'class': 'toggle'}),
-            'working_hours_start': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'time'}),
-            'working_hours_end': forms.TextInput(attrs={'class': 'input input-sm w-full', 'type': 'time'}),
+            'default_reminder_minutes': forms.TextInput(attrs=_INPUT_SM_NUMBER),
+            'auto_create_follow_up': forms.CheckboxInput(attrs=_TOGGLE),
+            'working_hours_start': forms.TextInput(attrs=_INPUT_SM_TIME),
+            'working_hours_end': forms.TextInput(attrs=_INPUT_SM_TIME),
         }
 
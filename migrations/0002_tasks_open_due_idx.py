@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status__in', ['pending', 'in_progress'])), fields=['hub_id', 'due_date'], name='tasks_open_due_idx'),
+        ),
+    ]
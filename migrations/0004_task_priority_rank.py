@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0003_drop_redundant_single_column_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_hub_id_ba183a_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='urgent', then=0), models.When(priority='high', then=1), models.When(priority='medium', then=2), models.When(priority='low', then=3), default=4, output_field=models.SmallIntegerField()), output_field=models.SmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['hub_id', 'priority_rank', 'due_date'], name='tasks_hub_priority_due_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0006_task_list_sort_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['hub_id', 'is_deleted', 'title', 'id'], name='tasks_list_title_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['hub_id', 'is_deleted', 'task_type', 'id'], name='tasks_list_type_idx'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='task',
+            name='tasks_task_hub_id_c10440_idx',
+        ),
+    ]
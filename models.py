@@ -1,4 +1,10 @@
+import uuid
+
+from django.contrib.postgres.indexes import GinIndex
+from django.core.cache import cache
 from django.db import models
+from django.db.models import BooleanField, Case, Q, SmallIntegerField, Value, When
+from django.db.models.functions import Now
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -33,6 +39,49 @@ STATUS_CHOICES = [
 
 PRIORITY_ORDER = {'urgent': 0, 'high': 1, 'medium': 2, 'low': 3}
 
+OPEN_STATUSES = frozenset(('pending', 'in_progress'))
+CLOSED_STATUSES = frozenset(('completed', 'cancelled'))
+
+TYPE_ICONS = {
+    'task': 'checkbox-outline',
+    'call': 'call-outline',
+    'meeting': 'people-outline',
+    'email': 'mail-outline',
+    'follow_up': 'arrow-redo-outline',
+}
+
+PRIORITY_COLORS = {
+    'low': 'success',
+    'medium': 'primary',
+    'high': 'warning',
+    'urgent': 'error',
+}
+
+STATUS_COLORS = {
+    'pending': 'warning',
+    'in_progress': 'primary',
+    'completed': 'success',
+    'cancelled': '',
+}
+
+
+def priority_rank_expression():
+    """SQL expression mapping priority to PRIORITY_ORDER (lower = more urgent)."""
+    return Case(
+        *[When(priority=p, then=rank) for p, rank in PRIORITY_ORDER.items()],
+        default=len(PRIORITY_ORDER),
+        output_field=SmallIntegerField(),
+    )
+
+
+def overdue_flag():
+    """SQL counterpart of Task.is_overdue, evaluated against the database clock."""
+    return Case(
+        When(Q(status__in=OPEN_STATUSES, due_date__lt=Now()), then=Value(True)),
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+
 
 # ============================================================================
 # Task
@@ -51,21 +100,18 @@ class Task(HubBaseModel):
         max_length=20,
         choices=TYPE_CHOICES,
         default='task',
-        db_index=True,
         verbose_name=_('Type'),
     )
     priority = models.CharField(
         max_length=20,
         choices=PRIORITY_CHOICES,
         default='medium',
-        db_index=True,
         verbose_name=_('Priority'),
     )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
         default='pending',
-        db_index=True,
         verbose_name=_('Status'),
     )
 
@@ -86,7 +132,6 @@ class Task(HubBaseModel):
     assigned_to = models.UUIDField(
         null=True,
         blank=True,
-        db_index=True,
         verbose_name=_('Assigned To'),
         help_text=_('UUID of the user assigned to this task'),
     )
@@ -146,26 +191,59 @@ class Task(HubBaseModel):
         verbose_name=_('Reminder Before (minutes)'),
     )
 
+    # Denormalized sort key (see PRIORITY_ORDER)
+    priority_rank = models.GeneratedField(
+        expression=priority_rank_expression(),
+        output_field=models.SmallIntegerField(),
+        db_persist=True,
+    )
+
     class Meta(HubBaseModel.Meta):
         db_table = 'tasks_task'
         ordering = ['-due_date', '-created_at']
         indexes = [
             models.Index(fields=['hub_id', 'status', 'due_date']),
-            models.Index(fields=['hub_id', 'task_type']),
             models.Index(fields=['hub_id', 'assigned_to']),
-            models.Index(fields=['hub_id', 'priority']),
+            models.Index(fields=['hub_id', 'priority_rank', 'due_date'], name='tasks_hub_priority_due_idx'),
             models.Index(fields=['hub_id', 'customer']),
+            models.Index(
+                fields=['hub_id', 'due_date'],
+                condition=models.Q(status__in=['pending', 'in_progress'], is_deleted=False),
+                name='tasks_open_due_idx',
+            ),
+            models.Index(fields=['hub_id', 'is_deleted', 'created_at', 'id'], name='tasks_list_created_idx'),
+            models.Index(fields=['hub_id', 'is_deleted', 'title', 'id'], name='tasks_list_title_idx'),
+            models.Index(fields=['hub_id', 'is_deleted', 'task_type', 'id'], name='tasks_list_type_idx'),
+            GinIndex(fields=['title'], opclasses=['gin_trgm_ops'], name='tasks_title_trgm'),
+            GinIndex(fields=['description'], opclasses=['gin_trgm_ops'], name='tasks_description_trgm'),
         ]
 
     def __str__(self):
         return self.title
 
+    LIST_CACHE_TIMEOUT = 60
+
+    @staticmethod
+    def list_version_key(hub_id):
+        return f'tasks:{hub_id}:list_version'
+
+    @classmethod
+    def list_cache_prefix(cls, hub_id):
+        """Versioned prefix for the hub's cached list data (see invalidate_list_cache)."""
+        version = cache.get_or_set(cls.list_version_key(hub_id), lambda: uuid.uuid4().hex, None)
+        return f'tasks:{hub_id}:{version}'
+
+    @classmethod
+    def invalidate_list_cache(cls, hub_id):
+        """Orphan every cached list entry for the hub; they expire after LIST_CACHE_TIMEOUT."""
+        cache.delete(cls.list_version_key(hub_id))
+
     # --- Properties ---
 
     @property
     def is_overdue(self):
         """Check if task is overdue (past due date and not completed/cancelled)."""
-        if self.due_date and self.status in ('pending', 'in_progress'):
+        if self.due_date and self.status in OPEN_STATUSES:
             return timezone.now() > self.due_date
         return False
 
@@ -173,8 +251,7 @@ class Task(HubBaseModel):
     def is_due_today(self):
         """Check if task is due today."""
         if self.due_date:
-            now = timezone.now()
-            return self.due_date.date() == now.date()
+            return self.due_date.date() == timezone.now().date()
         return False
 
     @property
@@ -189,47 +266,29 @@ class Task(HubBaseModel):
     @property
     def type_icon(self):
         """Return an icon name for the task type."""
-        icons = {
-            'task': 'checkbox-outline',
-            'call': 'call-outline',
-            'meeting': 'people-outline',
-            'email': 'mail-outline',
-            'follow_up': 'arrow-redo-outline',
-        }
-        return icons.get(self.task_type, 'checkbox-outline')
+        return TYPE_ICONS.get(self.task_type, 'checkbox-outline')
 
     @property
     def priority_color(self):
         """Return a color class for the priority level."""
-        colors = {
-            'low': 'success',
-            'medium': 'primary',
-            'high': 'warning',
-            'urgent': 'error',
-        }
-        return colors.get(self.priority, 'primary')
+        return PRIORITY_COLORS.get(self.priority, 'primary')
 
     @property
     def status_color(self):
         """Return a color class for the status."""
-        colors = {
-            'pending': 'warning',
-            'in_progress': 'primary',
-            'completed': 'success',
-            'cancelled': '',
-        }
-        return colors.get(self.status, '')
+        return STATUS_COLORS.get(self.status, '')
 
     @property
     def due_date_color(self):
         """Return a color class based on due date proximity."""
         if not self.due_date:
             return ''
-        if self.status in ('completed', 'cancelled'):
+        if self.status in CLOSED_STATUSES:
             return 'success' if self.status == 'completed' else ''
-        if self.is_overdue:
+        now = timezone.now()
+        if self.status in OPEN_STATUSES and now > self.due_date:
             return 'error'
-        if self.is_due_today:
+        if self.due_date.date() == now.date():
             return 'warning'
         return ''
 
@@ -242,17 +301,24 @@ class Task(HubBaseModel):
 
     # --- Methods ---
 
+    def _set_status(self, status, completed_at, now):
+        # update() sends no post_save, so drop the hub's cached list data here.
+        type(self).objects.filter(pk=self.pk).update(
+            status=status, completed_at=completed_at, updated_at=now,
+        )
+        type(self).invalidate_list_cache(self.hub_id)
+        self.status = status
+        self.completed_at = completed_at
+        self.updated_at = now
+
     def mark_complete(self):
         """Mark task as completed."""
-        self.status = 'completed'
-        self.completed_at = timezone.now()
-        self.save(update_fields=['status', 'completed_at', 'updated_at'])
+        now = timezone.now()
+        self._set_status('completed', now, now)
 
     def mark_reopen(self):
         """Reopen a completed/cancelled task."""
-        self.status = 'pending'
-        self.completed_at = None
-        self.save(update_fields=['status', 'completed_at', 'updated_at'])
+        self._set_status('pending', None, timezone.now())
 
 
 # ============================================================================
@@ -287,8 +353,18 @@ class TaskSettings(HubBaseModel):
     def __str__(self):
         return f'Task Settings ({self.hub_id})'
 
+    CACHE_TIMEOUT = 3600
+
+    @staticmethod
+    def cache_key(hub_id):
+        return f'tasksettings:{hub_id}'
+
     @classmethod
     def get_for_hub(cls, hub_id):
-        """Get or create settings for a hub."""
-        settings, _ = cls.objects.get_or_create(hub_id=hub_id)
+        """Get or create settings for a hub (cached, invalidated on save)."""
+        key = cls.cache_key(hub_id)
+        settings = cache.get(key)
+        if settings is None:
+            settings, _ = cls.objects.get_or_create(hub_id=hub_id)
+            cache.set(key, settings, cls.CACHE_TIMEOUT)
         return settings
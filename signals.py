@@ -0,0 +1,17 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Task, TaskSettings
+
+
+@receiver(post_save, sender=TaskSettings)
+@receiver(post_delete, sender=TaskSettings)
+def invalidate_task_settings_cache(sender, instance, **kwargs):
+    cache.delete(TaskSettings.cache_key(instance.hub_id))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_list_cache(sender, instance, **kwargs):
+    Task.invalidate_list_cache(instance.hub_id)
@@ -0,0 +1,91 @@
+"""Tests for tasks AI tools."""
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.test import RequestFactory
+from django.utils import timezone
+
+from tasks.ai_tools import CREATE_TASKS_BULK_MAX_ITEMS, LIST_TASKS_MAX_LIMIT, CreateTasksBulk, ListTasks
+from tasks.models import Task
+
+
+@pytest.fixture
+def tool_request(hub_id):
+    """Request carrying the test hub in its session."""
+    request = RequestFactory().post('/')
+    request.session = {'hub_id': str(hub_id), 'local_user_id': str(uuid.uuid4())}
+    return request
+
+
+@pytest.mark.django_db
+class TestCreateTasksBulk:
+    """create_tasks_bulk tool tests."""
+
+    def test_creates_tasks(self, tool_request, hub_id):
+        """Test every item is inserted for the session hub."""
+        result = CreateTasksBulk().execute({'tasks': [
+            {'title': 'Call back', 'task_type': 'call'},
+            {'title': 'Send proposal', 'priority': 'high'},
+        ]}, tool_request)
+        assert result['created'] == 2
+        tasks = Task.objects.filter(hub_id=hub_id).order_by('title')
+        assert [(t.title, t.task_type, t.priority) for t in tasks] == [
+            ('Call back', 'call', 'medium'),
+            ('Send proposal', 'task', 'high'),
+        ]
+        created_by = uuid.UUID(tool_request.session['local_user_id'])
+        assert all(t.created_by == created_by for t in tasks)
+
+    def test_rejects_too_many_items(self, tool_request, hub_id):
+        """Test calls above the item cap insert nothing."""
+        items = [{'title': f'Task {i}'} for i in range(CREATE_TASKS_BULK_MAX_ITEMS + 1)]
+        result = CreateTasksBulk().execute({'tasks': items}, tool_request)
+        assert 'error' in result
+        assert not Task.objects.filter(hub_id=hub_id).exists()
+
+
+@pytest.mark.django_db
+class TestListTasks:
+    """list_tasks tool tests."""
+
+    def test_cursor_walks_every_task_once(self, tool_request, hub_id):
+        """Test paging with cursors returns each task once, NULL due dates last per rank."""
+        now = timezone.now()
+        Task.objects.bulk_create([
+            Task(hub_id=hub_id, title=f'{priority} {i}', priority=priority,
+                 due_date=None if i % 2 else now + timedelta(days=i))
+            for priority in ('urgent', 'low')
+            for i in range(4)
+        ])
+        seen, cursor = [], None
+        while True:
+            args = {'limit': 3}
+            if cursor:
+                args['cursor'] = cursor
+            result = ListTasks().execute(args, tool_request)
+            seen.extend(result['tasks'])
+            cursor = result['next_cursor']
+            if not cursor:
+                break
+        assert len(seen) == 8
+        assert len({t['id'] for t in seen}) == 8
+        assert [t['priority'] for t in seen] == ['urgent'] * 4 + ['low'] * 4
+        assert [t['due_date'] is None for t in seen[:4]] == [False, False, True, True]
+
+    def test_invalid_cursor(self, tool_request):
+        """Test a garbage cursor returns an error instead of raising."""
+        for cursor in ('not-a-cursor', 'WyJ4IiwgbnVsbCwgIm5vLXV1aWQiXQ=='):
+            result = ListTasks().execute({'cursor': cursor}, tool_request)
+            assert result == {'error': 'Invalid cursor'}
+
+    def test_limit_is_clamped(self, tool_request, hub_id):
+        """Test limit is clamped to LIST_TASKS_MAX_LIMIT."""
+        Task.objects.bulk_create([
+            Task(hub_id=hub_id, title=f'Task {i}') for i in range(LIST_TASKS_MAX_LIMIT + 1)
+        ])
+        result = ListTasks().execute({'limit': LIST_TASKS_MAX_LIMIT * 10}, tool_request)
+        assert len(result['tasks']) == LIST_TASKS_MAX_LIMIT
+        assert result['next_cursor']
+        result = ListTasks().execute({'limit': 0}, tool_request)
+        assert len(result['tasks']) == 20
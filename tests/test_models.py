@@ -2,7 +2,7 @@
 import pytest
 from django.utils import timezone
 
-from tasks.models import Task
+from tasks.models import Task, TaskSettings
 
 
 @pytest.mark.django_db
@@ -36,3 +36,20 @@ class TestTask:
         assert Task.objects.filter(hub_id=hub_id).count() == 0
 
 
+@pytest.mark.django_db
+class TestTaskSettings:
+    """TaskSettings model tests."""
+
+    def test_get_for_hub_creates(self, hub_id):
+        """Test get_for_hub creates the hub's settings on first use."""
+        config = TaskSettings.get_for_hub(hub_id)
+        assert config.pk is not None
+        assert TaskSettings.objects.filter(hub_id=hub_id).count() == 1
+
+    def test_get_for_hub_sees_saved_changes(self, hub_id):
+        """Test saving settings invalidates the cached copy."""
+        config = TaskSettings.get_for_hub(hub_id)
+        assert TaskSettings.get_for_hub(hub_id).default_reminder_minutes == 30
+        config.default_reminder_minutes = 45
+        config.save()
+        assert TaskSettings.get_for_hub(hub_id).default_reminder_minutes == 45
@@ -54,6 +54,63 @@ class TestTaskViews:
         response = auth_client.get(url, {'sort': 'created_at', 'dir': 'desc'})
         assert response.status_code == 200
 
+    def test_list_invalid_params(self, auth_client):
+        """Test malformed paging and sort params fall back to defaults."""
+        url = reverse('tasks:tasks_list')
+        response = auth_client.get(url, {'per_page': 'abc', 'page': 'x', 'sort': 'bogus', 'dir': 'up'})
+        assert response.status_code == 200
+        assert response.context['per_page'] == 12
+
+    def test_list_cursor_pagination(self, auth_client, hub_id):
+        """Test keyset cursor continues after the first page."""
+        from tasks.models import Task
+        Task.objects.bulk_create([Task(hub_id=hub_id, title=f'Task {i:02d}') for i in range(13)])
+        url = reverse('tasks:tasks_list')
+        response = auth_client.get(url, {'per_page': 12})
+        next_cursor = response.context['next_cursor']
+        assert next_cursor
+        response = auth_client.get(url, {'per_page': 12, 'cursor': next_cursor})
+        assert response.status_code == 200
+        assert [t.title for t in response.context['tasks']] == ['Task 12']
+        assert response.context['next_cursor'] is None
+        assert response.context['prev_cursor']
+
+    def test_list_invalid_cursor(self, auth_client):
+        """Test a malformed cursor falls back to the first page."""
+        url = reverse('tasks:tasks_list')
+        response = auth_client.get(url, {'cursor': 'not-a-cursor'})
+        assert response.status_code == 200
+
+    def test_list_stale_cursor(self, auth_client, task):
+        """Test a cursor past the last row falls back to page 1."""
+        import base64
+        import json
+        key = ['title', 'zzzz', str(task.pk), False]
+        cursor = base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+        response = auth_client.get(reverse('tasks:tasks_list'), {'cursor': cursor})
+        assert response.status_code == 200
+        assert response.context['page_obj'].number == 1
+        assert [t.pk for t in response.context['tasks']] == [task.pk]
+
+    def test_list_cursor_wrong_value_type(self, auth_client, task):
+        """Test a cursor whose value does not match the column type falls back to page 1."""
+        import base64
+        import json
+        url = reverse('tasks:tasks_list')
+        for sort, column in (('priority', 'priority_rank'), ('is_recurring', 'is_recurring')):
+            key = [column, 'x', str(task.pk), False]
+            cursor = base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+            response = auth_client.get(url, {'sort': sort, 'cursor': cursor})
+            assert response.status_code == 200
+            assert response.context['page_obj'] is not None
+
+    def test_list_count_refreshes_after_add(self, auth_client, task):
+        """Test the cached list count is invalidated when a task is created."""
+        url = reverse('tasks:tasks_list')
+        assert auth_client.get(url).context['page_obj'].paginator.count == 1
+        auth_client.post(reverse('tasks:task_add'), {'title': 'Another'})
+        assert auth_client.get(url).context['page_obj'].paginator.count == 2
+
     def test_export_csv(self, auth_client):
         """Test CSV export."""
         url = reverse('tasks:tasks_list')
@@ -113,6 +170,13 @@ class TestTaskViews:
         task.refresh_from_db()
         assert task.is_deleted is True
 
+    def test_delete_already_deleted(self, auth_client, task):
+        """Test deleting a soft-deleted task returns 404."""
+        url = reverse('tasks:task_delete', args=[task.pk])
+        auth_client.post(url)
+        response = auth_client.post(url)
+        assert response.status_code == 404
+
     def test_bulk_delete(self, auth_client, task):
         """Test bulk delete."""
         url = reverse('tasks:tasks_bulk_action')
@@ -121,6 +185,52 @@ class TestTaskViews:
         task.refresh_from_db()
         assert task.is_deleted is True
 
+    def test_bulk_delete_large_selection(self, auth_client, hub_id):
+        """Test bulk delete above BULK_VALUES_THRESHOLD ids."""
+        from tasks.models import Task
+        from tasks.views import BULK_VALUES_THRESHOLD
+        tasks = Task.objects.bulk_create([
+            Task(hub_id=hub_id, title=f'Task {i}') for i in range(BULK_VALUES_THRESHOLD + 5)
+        ])
+        url = reverse('tasks:tasks_bulk_action')
+        ids = ','.join(str(t.pk) for t in tasks[1:])
+        response = auth_client.post(url, {'ids': ids, 'action': 'delete'})
+        assert response.status_code == 200
+        assert Task.objects.filter(hub_id=hub_id).count() == 1
+        assert Task.objects.filter(hub_id=hub_id).get().pk == tasks[0].pk
+
+    def test_bulk_complete(self, auth_client, task):
+        """Test bulk complete."""
+        url = reverse('tasks:tasks_bulk_action')
+        response = auth_client.post(url, {'ids': str(task.pk), 'action': 'complete'})
+        assert response.status_code == 200
+        task.refresh_from_db()
+        assert task.status == 'completed'
+        assert task.completed_at is not None
+
+    def test_bulk_complete_creates_follow_ups(self, auth_client, hub_id):
+        """Test bulk complete creates follow-ups for open calls/meetings only."""
+        from tasks.models import Task, TaskSettings
+        config = TaskSettings.get_for_hub(hub_id)
+        config.auto_create_follow_up = True
+        config.save()
+        call = Task.objects.create(hub_id=hub_id, title='C' * 255, task_type='call')
+        meeting = Task.objects.create(hub_id=hub_id, title='Kickoff', task_type='meeting')
+        cancelled = Task.objects.create(hub_id=hub_id, title='Dropped', task_type='call', status='cancelled')
+        url = reverse('tasks:tasks_bulk_action')
+        ids = ','.join(str(t.pk) for t in (call, meeting, cancelled))
+        response = auth_client.post(url, {'ids': ids, 'action': 'complete'})
+        assert response.status_code == 200
+        follow_ups = Task.objects.filter(hub_id=hub_id, task_type='follow_up')
+        titles = sorted(follow_ups.values_list('title', flat=True))
+        assert len(titles) == 2
+        assert 'Follow-up: Kickoff' in titles
+        assert all(len(title) <= 255 for title in titles)
+        cancelled.refresh_from_db()
+        assert cancelled.status == 'cancelled'
+        auth_client.post(url, {'ids': ids, 'action': 'complete'})
+        assert follow_ups.count() == 2
+
     def test_list_requires_auth(self, client):
         """Test list requires authentication."""
         url = reverse('tasks:tasks_list')
@@ -1,13 +1,26 @@
 """
 Tasks Module Views
 """
-from django.core.paginator import Paginator
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from datetime import datetime
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import connection, transaction
 from django.db.models import Q, Count
-from django.http import HttpResponse
+from django.db.models.expressions import RawSQL
+from django.http import Http404, HttpResponse, HttpResponseBadRequest
 from django.urls import reverse
 from django.shortcuts import get_object_or_404, render as django_render
 from django.utils import timezone
-from django.utils.translation import gettext_lazy as _
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.utils.translation import get_language, gettext, gettext_lazy as _
 from django.views.decorators.http import require_POST
 
 from apps.accounts.decorators import login_required, permission_required
@@ -15,9 +28,15 @@ from apps.core.htmx import htmx_view
 from apps.core.services import export_to_csv, export_to_excel
 from apps.modules_runtime.navigation import with_module_nav
 
-from .models import Task, TaskSettings
+from .models import OPEN_STATUSES, PRIORITY_ORDER, TYPE_CHOICES, Task, TaskSettings
 
-PER_PAGE_CHOICES = [12, 24, 48, 96, 0]
+# per_page query value -> rows per page (0 = all)
+PER_PAGE_CHOICES = {str(n): n for n in (12, 24, 48, 96, 0)}
+# Numbered pagination counts at most this many rows; deeper pages go through cursors
+LIST_COUNT_LIMIT = 1000
+BULK_MAX_IDS = 1000
+# Above this many ids, match against a VALUES list instead of IN (%s, %s, ...)
+BULK_VALUES_THRESHOLD = 100
 
 
 # ======================================================================
@@ -41,17 +60,146 @@ def dashboard(request):
 TASK_SORT_FIELDS = {
     'title': 'title',
     'task_type': 'task_type',
-    'priority': 'priority',
+    'priority': 'priority_rank',
     'status': 'status',
     'customer': 'customer',
     'is_recurring': 'is_recurring',
     'created_at': 'created_at',
 }
 
+# (sort, dir) query params -> (column, descending, order_by args), with id as tiebreaker
+TASK_ORDERINGS = {
+    (key, sort_dir): (column, sort_dir == 'desc', (f'-{column}', '-id') if sort_dir == 'desc' else (column, 'id'))
+    for key, column in TASK_SORT_FIELDS.items()
+    for sort_dir in ('asc', 'desc')
+}
+
+# Sort columns that are NOT NULL, so (column, id) is a total order usable as a keyset.
+KEYSET_SORT_FIELDS = frozenset(('title', 'task_type', 'priority_rank', 'status', 'is_recurring', 'created_at'))
+# Python type of each keyset column's cursor value after decoding
+KEYSET_VALUE_TYPES = {
+    'title': str,
+    'task_type': str,
+    'priority_rank': int,
+    'status': str,
+    'is_recurring': bool,
+    'created_at': datetime,
+}
+
+@lru_cache(maxsize=16)
+def _row_labels(language):
+    """Translated strings repeated on every table row, resolved once per language."""
+    return {
+        'yes': gettext('Yes'),
+        'no': gettext('No'),
+        'edit': gettext('Edit'),
+        'delete': gettext('Delete'),
+    }
+
+# Columns rendered by tasks_list.html (and exported); everything else is deferred.
+TASK_LIST_FIELDS = ('title', 'task_type', 'priority', 'status', 'customer', 'is_recurring')
+
+class CachedCountPaginator(Paginator):
+    """Paginator whose row count is shared across requests under ``cache_key``.
+
+    Counting stops after ``count_limit`` rows and sets ``is_capped``; rows past the
+    limit are reached through keyset cursors instead of page numbers.
+    """
+
+    def __init__(self, object_list, per_page, cache_key, count_limit, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.count_limit = count_limit
+
+    @cached_property
+    def _raw_count(self):
+        count = cache.get(self.cache_key)
+        if count is None:
+            count = self.object_list[:self.count_limit + 1].count()
+            cache.set(self.cache_key, count, Task.LIST_CACHE_TIMEOUT)
+        return count
+
+    @cached_property
+    def count(self):
+        return min(self._raw_count, self.count_limit)
+
+    @property
+    def is_capped(self):
+        return self._raw_count > self.count_limit
+
+def _first_page(qs, per_page, count_key):
+    """Page 1 of ``qs``; only counts rows when they do not fit on one page."""
+    rows = list(qs[:per_page + 1] if per_page > 0 else qs)
+    if per_page <= 0 or len(rows) <= per_page:
+        return Paginator(rows, max(per_page, len(rows), 1)).page(1)
+    return Page(rows[:per_page], 1, CachedCountPaginator(qs, per_page, count_key, LIST_COUNT_LIMIT))
+
+def _search_filter(query):
+    """Search Q whose every OR branch is indexable.
+
+    title/description ILIKE use the trigram GIN indexes; task_type and priority are
+    choice columns, so the matching keys are resolved here and looked up exactly.
+    """
+    needle = query.lower()
+    q = Q(title__icontains=query) | Q(description__icontains=query)
+    task_types = [key for key, label in TYPE_CHOICES if needle in key]
+    if task_types:
+        q |= Q(task_type__in=task_types)
+    ranks = [rank for key, rank in PRIORITY_ORDER.items() if needle in key]
+    if ranks:
+        q |= Q(priority_rank__in=ranks)
+    return q
+
+def _count_cache_key(hub_id, search_query):
+    digest = hashlib.blake2b(search_query.encode(), digest_size=16).hexdigest()
+    return f'{Task.list_cache_prefix(hub_id)}:count:{digest}'
+
+def _encode_cursor(column, row, backwards=False):
+    """Opaque keyset cursor for ``row`` under the (column, id) sort key."""
+    value = getattr(row, column)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    key = [column, value, str(row.pk), backwards]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+def _decode_cursor(token, column):
+    """Return (value, pk, backwards) from a cursor built for ``column``.
+
+    Raises ValueError for malformed tokens or tokens from another sort column.
+    """
+    try:
+        key_column, value, pk, backwards = json.loads(base64.urlsafe_b64decode(token.encode()))
+        pk = uuid.UUID(str(pk))
+        if column == 'created_at':
+            value = parse_datetime(value)
+    except (binascii.Error, TypeError, ValueError, AttributeError):
+        raise ValueError('Invalid cursor')
+    if key_column != column or type(value) is not KEYSET_VALUE_TYPES[column]:
+        raise ValueError('Invalid cursor')
+    return value, pk, bool(backwards)
+
+def _keyset_page(qs, column, desc, value, pk, backwards, per_page):
+    """Rows after (or, if ``backwards``, before) the cursor key, with the adjacent cursors."""
+    op = 'lt' if desc != backwards else 'gt'
+    if backwards:
+        qs = qs.reverse()
+    # The leading inclusive bound gives the index scan a start key; the OR then drops ties up to pk.
+    after = Q(**{f'{column}__{op}': value}) | Q(**{column: value, f'id__{op}': pk})
+    rows = list(qs.filter(Q(**{f'{column}__{op}e': value}) & after)[:per_page + 1])
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+    if backwards:
+        rows.reverse()
+    if not rows:
+        return rows, None, None
+    next_cursor = _encode_cursor(column, rows[-1]) if has_more or backwards else None
+    prev_cursor = _encode_cursor(column, rows[0], backwards=True) if has_more or not backwards else None
+    return rows, next_cursor, prev_cursor
+
 def _build_tasks_context(hub_id, per_page=10):
-    qs = Task.objects.filter(hub_id=hub_id, is_deleted=False).order_by('title')
-    paginator = Paginator(qs, per_page if per_page > 0 else max(qs.count(), 1))
-    page_obj = paginator.get_page(1)
+    qs = Task.objects.filter(hub_id=hub_id, is_deleted=False).select_related('customer').only(*TASK_LIST_FIELDS)
+    qs = qs.order_by(*TASK_ORDERINGS['title', 'asc'][2])
+    page_obj = _first_page(qs, per_page, _count_cache_key(hub_id, ''))
     return {
         'tasks': page_obj,
         'page_obj': page_obj,
@@ -60,6 +208,7 @@ def _build_tasks_context(hub_id, per_page=10):
         'sort_dir': 'asc',
         'current_view': 'table',
         'per_page': per_page,
+        'labels': _row_labels(get_language()),
     }
 
 def _render_tasks_list(request, hub_id, per_page=10):
@@ -76,19 +225,18 @@ def tasks_list(request):
     sort_dir = request.GET.get('dir', 'asc')
     page_number = request.GET.get('page', 1)
     current_view = request.GET.get('view', 'table')
-    per_page = int(request.GET.get('per_page', 12))
-    if per_page not in PER_PAGE_CHOICES:
-        per_page = 12
+    per_page = PER_PAGE_CHOICES.get(request.GET.get('per_page'), 12)
 
-    qs = Task.objects.filter(hub_id=hub_id, is_deleted=False)
+    column, desc, ordering = TASK_ORDERINGS.get((sort_field, sort_dir), TASK_ORDERINGS['title', 'asc'])
+    keyset = per_page > 0 and column in KEYSET_SORT_FIELDS
+
+    qs = Task.objects.filter(hub_id=hub_id, is_deleted=False).select_related('customer')
+    qs = qs.only(*TASK_LIST_FIELDS, column) if keyset else qs.only(*TASK_LIST_FIELDS)
 
     if search_query:
-        qs = qs.filter(Q(title__icontains=search_query) | Q(description__icontains=search_query) | Q(task_type__icontains=search_query) | Q(priority__icontains=search_query))
+        qs = qs.filter(_search_filter(search_query))
 
-    order_by = TASK_SORT_FIELDS.get(sort_field, 'title')
-    if sort_dir == 'desc':
-        order_by = f'-{order_by}'
-    qs = qs.order_by(order_by)
+    qs = qs.order_by(*ordering)
 
     export_format = request.GET.get('export')
     if export_format in ('csv', 'excel'):
@@ -98,59 +246,67 @@ def tasks_list(request):
             return export_to_csv(qs, fields=fields, headers=headers, filename='tasks.csv')
         return export_to_excel(qs, fields=fields, headers=headers, filename='tasks.xlsx')
 
-    paginator = Paginator(qs, per_page if per_page > 0 else max(qs.count(), 1))
-    page_obj = paginator.get_page(page_number)
-
-    if request.htmx and request.htmx.target == 'datatable-body':
-        return django_render(request, 'tasks/partials/tasks_list.html', {
-            'tasks': page_obj, 'page_obj': page_obj,
-            'search_query': search_query, 'sort_field': sort_field,
-            'sort_dir': sort_dir, 'current_view': current_view, 'per_page': per_page,
-        })
+    # Deep pages are reached through keyset cursors; OFFSET paging only backs the numbered buttons.
+    cursor = request.GET.get('cursor') if keyset else None
+    if cursor:
+        try:
+            value, pk, backwards = _decode_cursor(cursor, column)
+        except ValueError:
+            cursor = None
+    tasks = None
+    if cursor:
+        page_obj = None
+        tasks, next_cursor, prev_cursor = _keyset_page(qs, column, desc, value, pk, backwards, per_page)
+        if not tasks:
+            # A stale cursor past the remaining rows falls back to page 1.
+            page_number = 1
+    if not tasks:
+        if per_page > 0:
+            paginator = CachedCountPaginator(qs, per_page, _count_cache_key(hub_id, search_query), LIST_COUNT_LIMIT)
+        else:
+            # "All": size the single page from the rows themselves, never from a cached count.
+            rows = list(qs)
+            paginator = Paginator(rows, max(len(rows), 1))
+        page_obj = tasks = paginator.get_page(page_number)
+        # keyset implies per_page > 0, i.e. a CachedCountPaginator
+        has_next = keyset and (page_obj.has_next() or paginator.is_capped)
+        next_cursor = _encode_cursor(column, page_obj[-1]) if has_next else None
+        prev_cursor = None
 
-    return {
-        'tasks': page_obj, 'page_obj': page_obj,
+    ctx = {
+        'tasks': tasks, 'page_obj': page_obj,
+        'next_cursor': next_cursor, 'prev_cursor': prev_cursor,
         'search_query': search_query, 'sort_field': sort_field,
         'sort_dir': sort_dir, 'current_view': current_view, 'per_page': per_page,
+        'labels': _row_labels(get_language()),
     }
+    if request.htmx and request.htmx.target == 'datatable-body':
+        return django_render(request, 'tasks/partials/tasks_list.html', ctx)
+    return ctx
+
+# task_add/task_edit form fields, grouped by how the POSTed string is coerced
+TASK_TEXT_FIELDS = (
+    'title', 'description', 'task_type', 'priority', 'status',
+    'result', 'location', 'recurrence_rule',
+)
+TASK_NULLABLE_FIELDS = ('due_date', 'completed_at', 'assigned_to', 'related_lead')
+TASK_INT_FIELDS = ('duration_minutes', 'reminder_before_minutes')
+
+def _task_form_data(post):
+    """Field values for Task from a task_add/task_edit POST."""
+    get = post.get
+    data = {name: get(name, '').strip() for name in TASK_TEXT_FIELDS}
+    data.update({name: get(name, '').strip() or None for name in TASK_NULLABLE_FIELDS})
+    data.update({name: int(get(name) or 0) for name in TASK_INT_FIELDS})
+    data['is_recurring'] = get('is_recurring') == 'on'
+    return data
 
 @login_required
 @htmx_view('tasks/pages/task_add.html', 'tasks/partials/task_add_content.html')
 def task_add(request):
     hub_id = request.session.get('hub_id')
     if request.method == 'POST':
-        title = request.POST.get('title', '').strip()
-        description = request.POST.get('description', '').strip()
-        task_type = request.POST.get('task_type', '').strip()
-        priority = request.POST.get('priority', '').strip()
-        status = request.POST.get('status', '').strip()
-        due_date = request.POST.get('due_date') or None
-        completed_at = request.POST.get('completed_at') or None
-        assigned_to = request.POST.get('assigned_to', '').strip()
-        related_lead = request.POST.get('related_lead', '').strip()
-        duration_minutes = int(request.POST.get('duration_minutes', 0) or 0)
-        result = request.POST.get('result', '').strip()
-        location = request.POST.get('location', '').strip()
-        is_recurring = request.POST.get('is_recurring') == 'on'
-        recurrence_rule = request.POST.get('recurrence_rule', '').strip()
-        reminder_before_minutes = int(request.POST.get('reminder_before_minutes', 0) or 0)
-        obj = Task(hub_id=hub_id)
-        obj.title = title
-        obj.description = description
-        obj.task_type = task_type
-        obj.priority = priority
-        obj.status = status
-        obj.due_date = due_date
-        obj.completed_at = completed_at
-        obj.assigned_to = assigned_to
-        obj.related_lead = related_lead
-        obj.duration_minutes = duration_minutes
-        obj.result = result
-        obj.location = location
-        obj.is_recurring = is_recurring
-        obj.recurrence_rule = recurrence_rule
-        obj.reminder_before_minutes = reminder_before_minutes
-        obj.save()
+        Task(hub_id=hub_id, **_task_form_data(request.POST)).save()
         response = HttpResponse(status=204)
         response['HX-Redirect'] = reverse('tasks:tasks_list')
         return response
@@ -162,22 +318,13 @@ def task_edit(request, pk):
     hub_id = request.session.get('hub_id')
     obj = get_object_or_404(Task, pk=pk, hub_id=hub_id, is_deleted=False)
     if request.method == 'POST':
-        obj.title = request.POST.get('title', '').strip()
-        obj.description = request.POST.get('description', '').strip()
-        obj.task_type = request.POST.get('task_type', '').strip()
-        obj.priority = request.POST.get('priority', '').strip()
-        obj.status = request.POST.get('status', '').strip()
-        obj.due_date = request.POST.get('due_date') or None
-        obj.completed_at = request.POST.get('completed_at') or None
-        obj.assigned_to = request.POST.get('assigned_to', '').strip()
-        obj.related_lead = request.POST.get('related_lead', '').strip()
-        obj.duration_minutes = int(request.POST.get('duration_minutes', 0) or 0)
-        obj.result = request.POST.get('result', '').strip()
-        obj.location = request.POST.get('location', '').strip()
-        obj.is_recurring = request.POST.get('is_recurring') == 'on'
-        obj.recurrence_rule = request.POST.get('recurrence_rule', '').strip()
-        obj.reminder_before_minutes = int(request.POST.get('reminder_before_minutes', 0) or 0)
-        obj.save()
+        changed = []
+        for name, value in _task_form_data(request.POST).items():
+            if getattr(obj, name) != value:
+                setattr(obj, name, value)
+                changed.append(name)
+        if changed:
+            obj.save(update_fields=[*changed, 'updated_by', 'updated_at'])
         return _render_tasks_list(request, hub_id)
     return {'obj': obj}
 
@@ -185,21 +332,75 @@ def task_edit(request, pk):
 @require_POST
 def task_delete(request, pk):
     hub_id = request.session.get('hub_id')
-    obj = get_object_or_404(Task, pk=pk, hub_id=hub_id, is_deleted=False)
-    obj.is_deleted = True
-    obj.deleted_at = timezone.now()
-    obj.save(update_fields=['is_deleted', 'deleted_at', 'updated_at'])
+    now = timezone.now()
+    if not Task.objects.filter(pk=pk, hub_id=hub_id, is_deleted=False).update(is_deleted=True, deleted_at=now, updated_at=now):
+        raise Http404
+    Task.invalidate_list_cache(hub_id)
     return _render_tasks_list(request, hub_id)
 
+def _parse_ids(raw):
+    """Parse a comma-separated id list into UUIDs, skipping malformed entries.
+
+    Returns None when more than BULK_MAX_IDS ids are submitted.
+    """
+    values = raw.split(',', BULK_MAX_IDS)
+    if len(values) > BULK_MAX_IDS:
+        return None
+    ids = []
+    append = ids.append
+    for value in values:
+        try:
+            append(uuid.UUID(value.strip()))
+        except ValueError:
+            pass
+    return ids
+
+def _id_filter(ids):
+    """Q matching the given task ids, as a VALUES join for large batches (Postgres)."""
+    if len(ids) <= BULK_VALUES_THRESHOLD or connection.vendor != 'postgresql':
+        return Q(id__in=ids)
+    values = ','.join(['(%s::uuid)'] * len(ids))
+    return Q(id__in=RawSQL(f'SELECT x FROM (VALUES {values}) AS t(x)', ids))
+
+def _bulk_complete(hub_id, qs, now):
+    """Complete every open task in ``qs``, creating follow-ups in one INSERT if enabled."""
+    qs = qs.filter(status__in=OPEN_STATUSES)
+    title_max = Task._meta.get_field('title').max_length
+    with transaction.atomic():
+        sources = []
+        if TaskSettings.get_for_hub(hub_id).auto_create_follow_up:
+            # Row locks make a concurrent submit wait here, then skip the rows this one completed.
+            sources = list(
+                qs.select_for_update().filter(task_type__in=('call', 'meeting'))
+                .values('title', 'customer_id', 'related_lead')
+            )
+        qs.update(status='completed', completed_at=now, updated_at=now)
+        Task.objects.bulk_create([
+            Task(
+                hub_id=hub_id,
+                title=f"{_('Follow-up')}: {src['title']}"[:title_max],
+                task_type='follow_up',
+                customer_id=src['customer_id'],
+                related_lead=src['related_lead'],
+            )
+            for src in sources
+        ], batch_size=500)
+
 @login_required
 @require_POST
 def tasks_bulk_action(request):
     hub_id = request.session.get('hub_id')
-    ids = [i.strip() for i in request.POST.get('ids', '').split(',') if i.strip()]
+    ids = _parse_ids(request.POST.get('ids', ''))
+    if ids is None:
+        return HttpResponseBadRequest()
     action = request.POST.get('action', '')
-    qs = Task.objects.filter(hub_id=hub_id, is_deleted=False, id__in=ids)
+    now = timezone.now()
+    qs = Task.objects.filter(_id_filter(ids), hub_id=hub_id, is_deleted=False)
     if action == 'delete':
-        qs.update(is_deleted=True, deleted_at=timezone.now())
+        qs.update(is_deleted=True, deleted_at=now, updated_at=now)
+    elif action == 'complete':
+        _bulk_complete(hub_id, qs, now)
+    Task.invalidate_list_cache(hub_id)
     return _render_tasks_list(request, hub_id)
 
 
@@ -213,7 +414,7 @@ def tasks_bulk_action(request):
 @htmx_view('tasks/pages/settings.html', 'tasks/partials/settings_content.html')
 def settings_view(request):
     hub_id = request.session.get('hub_id')
-    config, _ = TaskSettings.objects.get_or_create(hub_id=hub_id)
+    config = TaskSettings.get_for_hub(hub_id)
     if request.method == 'POST':
         config.default_reminder_minutes = request.POST.get('default_reminder_minutes', config.default_reminder_minutes)
         config.auto_create_follow_up = request.POST.get('auto_create_follow_up') == 'on'